@@ -3,7 +3,9 @@
 
 Used as a background process by entrypoint.sh for every deployment.
 Reads lines from stdin (connected via FIFO) and sends them to CloudWatch Logs
-in small batches for near-real-time visibility into deployment progress.
+in batches for near-real-time visibility into deployment progress. A batch is
+sent when it reaches the event or byte limit, or once it has been pending for
+FLUSH_INTERVAL seconds (including while stdin is idle).
 
 Supports per-phase log streams via sentinel lines. When a line matching
 ``###STREAM:<stream-name>`` is received, the logger flushes any pending batch,
@@ -11,22 +13,62 @@ creates the new log stream, and switches to it. This allows each deployment
 phase (bootstrap, discover, plan, etc.) to write to its own stream while
 sharing a common timestamp prefix as the correlation key.
 
+CloudWatch API calls run on a background sender thread so stdin keeps
+draining while a PutLogEvents request is in flight; otherwise a slow call
+could fill the FIFO and stall the producer.
+
 Best-effort: all exceptions are caught and suppressed to avoid disrupting
-the deployment pipeline.
+the deployment pipeline. Batches are dropped if the send queue is full.
 """
 
 import contextlib
+import queue
 import re
+import select
 import sys
+import threading
 import time
 
 import boto3
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+# Matches ANSI escape sequences: CSI (colors, erase line, cursor movement, etc.)
+# and OSC (window titles, hyperlinks) terminated by BEL or ST. Lines are
+# stripped as raw bytes, before UTF-8 decoding; escapes are always ASCII.
+ANSI_ESCAPE_RE = re.compile(rb"\x1b(?:\[[\x30-\x3f]*[\x20-\x2f]*[\x40-\x7e]|\][^\x07\x1b]*(?:\x07|\x1b\\))")
 
-# Matches ANSI escape sequences (colors, cursor movement, etc.)
-ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*m")
+# Every ANSI escape sequence starts with ESC; lines without it skip the regex
+ESC = b"\x1b"
 
 # Sentinel prefix used to switch log streams mid-run
-STREAM_SENTINEL = "###STREAM:"
+STREAM_SENTINEL = b"###STREAM:"
+
+# PutLogEvents limits are 10,000 events and 1,048,576 bytes per call; stay below both
+MAX_BATCH_EVENTS = 1000
+MAX_BATCH_BYTES = 800000
+
+# Maximum seconds a pending batch waits before being sent
+FLUSH_INTERVAL = 1.0
+
+# Bytes requested from stdin per read
+READ_SIZE = 65536
+
+# CloudWatch Logs max event size is 256KB, plus 26 bytes of accounting overhead per event
+MAX_EVENT_BYTES = 262144
+EVENT_OVERHEAD_BYTES = 26
+
+# Oversized events are cut so the message, marker and overhead fit in MAX_EVENT_BYTES
+TRUNCATION_MARKER = "... [truncated]"
+TRUNCATE_AT = MAX_EVENT_BYTES - EVENT_OVERHEAD_BYTES - len(TRUNCATION_MARKER.encode())
+
+# Batches waiting for the sender thread before new ones are dropped
+SEND_QUEUE_SIZE = 32
+
+# Seconds to wait for queued batches to be sent on shutdown
+SHUTDOWN_TIMEOUT = 5
+
+# Log streams known to exist, so switching back to a stream skips the API call
+_created_streams: set[str] = set()
 
 
 def main():
@@ -43,53 +85,93 @@ def main():
 
     client = boto3.client("logs", region_name=region)
 
+    # The initial stream is created by entrypoint.sh before the logger starts
+    _created_streams.add(current_stream)
+
+    # Requests for the sender thread: (log_stream, [(timestamp, message), ...]) or (log_stream, None)
+    # to create a stream. PutLogEvents calls must stay ordered per stream, so a
+    # single sender handles them sequentially.
+    outbox = queue.Queue(maxsize=SEND_QUEUE_SIZE)
+    sender = threading.Thread(target=_sender, args=(client, log_group, outbox), daemon=True)
+    sender.start()
+
+    # Read stdin in large blocks rather than line by line; a FIFO may be
+    # unbuffered, which makes readline() issue one read(2) per byte
+    stdin = sys.stdin.buffer
+    pending = b""
+
     batch = []
     batch_bytes = 0
-    last_flush = time.time()
+    batch_started = 0.0
 
     try:
         while True:
-            line = sys.stdin.readline()
-            if not line:
-                break
-
-            stripped = line.rstrip("\n")
+            # Flush a pending batch once it is FLUSH_INTERVAL old, waiting on
+            # stdin no longer than that so quiet producers are still delivered.
+            # read1() drains the reader's buffer, so select() sees all unread input.
+            if batch:
+                remaining = FLUSH_INTERVAL - (time.monotonic() - batch_started)
+                if remaining <= 0 or not select.select([stdin], [], [], remaining)[0]:
+                    _submit(outbox, current_stream, batch)
+                    batch = []
+                    batch_bytes = 0
 
-            # Check for stream-switch sentinel
-            if stripped.startswith(STREAM_SENTINEL):
-                if batch:
-                    _flush(client, log_group, current_stream, batch)
+            chunk = stdin.read1(READ_SIZE)
+
+            # Lines from one read arrived together and share a timestamp,
+            # so the clock is read once per chunk rather than once per line
+            timestamp = time.time_ns() // 1_000_000
+
+            if chunk:
+                # Keep any trailing partial line for the next read
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+            else:
+                lines = [pending] if pending else []
+
+            for line in lines:
+                # Check for stream-switch sentinel
+                if line.startswith(STREAM_SENTINEL):
+                    if batch:
+                        _submit(outbox, current_stream, batch)
+                        batch = []
+                        batch_bytes = 0
+                    new_stream = line.removeprefix(STREAM_SENTINEL).decode("utf-8", errors="replace")
+                    # Never dropped: later batches depend on the stream existing
+                    outbox.put((new_stream, None))
+                    current_stream = new_stream
+                    continue
+
+                if ESC in line:
+                    line = ANSI_ESCAPE_RE.sub(b"", line)
+                if not line:
+                    continue
+
+                # Invalid UTF-8 is replaced, which changes the encoded size,
+                # so only that (rare) case needs re-encoding to measure it
+                try:
+                    message = line.decode("utf-8")
+                    event_bytes = len(line)
+                except UnicodeDecodeError:
+                    message = line.decode("utf-8", errors="replace")
+                    event_bytes = len(message.encode("utf-8"))
+
+                if event_bytes > MAX_EVENT_BYTES:
+                    message = line[:TRUNCATE_AT].decode("utf-8", errors="ignore") + TRUNCATION_MARKER
+                    event_bytes = len(message.encode("utf-8"))
+
+                if not batch:
+                    batch_started = time.monotonic()
+                batch.append((timestamp, message))
+                batch_bytes += event_bytes + EVENT_OVERHEAD_BYTES
+
+                if len(batch) >= MAX_BATCH_EVENTS or batch_bytes >= MAX_BATCH_BYTES:
+                    _submit(outbox, current_stream, batch)
                     batch = []
                     batch_bytes = 0
-                    last_flush = time.time()
-                new_stream = stripped.removeprefix(STREAM_SENTINEL)
-                _create_stream(client, log_group, new_stream)
-                current_stream = new_stream
-                continue
-
-            message = ANSI_ESCAPE_RE.sub("", stripped)
-            if not message:
-                continue
-
-            # CloudWatch Logs max event size is 256KB
-            encoded = message.encode("utf-8")
-            if len(encoded) > 262144:
-                message = message[:262000] + "... [truncated]"
-                encoded = message.encode("utf-8")
-
-            timestamp = int(time.time() * 1000)
-            event = {"timestamp": timestamp, "message": message}
-            event_bytes = len(encoded) + 26  # 26 bytes overhead per event
-
-            batch.append(event)
-            batch_bytes += event_bytes
-
-            now = time.time()
-            if len(batch) >= 10 or batch_bytes >= 800000 or (now - last_flush) >= 1:
-                _flush(client, log_group, current_stream, batch)
-                batch = []
-                batch_bytes = 0
-                last_flush = now
+
+            if not chunk:
+                break
 
     except KeyboardInterrupt:
         pass
@@ -97,23 +179,54 @@ def main():
         pass
     finally:
         if batch:
-            _flush(client, log_group, current_stream, batch)
+            _submit(outbox, current_stream, batch)
+        outbox.put(None)
+        sender.join(timeout=SHUTDOWN_TIMEOUT)
+
+
+def _submit(outbox, log_stream, events):
+    """Queue a batch for the sender thread, dropping it (with a notice) if the queue is full."""
+    try:
+        outbox.put_nowait((log_stream, events))
+    except queue.Full:
+        print(f"cloudwatch_logger: dropped {len(events)} event(s) for {log_stream}: send queue full", file=sys.stderr)
+
+
+def _sender(client, log_group, outbox):
+    """Send queued requests to CloudWatch Logs in order until a None sentinel."""
+    while (request := outbox.get()) is not None:
+        log_stream, events = request
+        if events is None:
+            _create_stream(client, log_group, log_stream)
+        else:
+            _flush(client, log_group, log_stream, events)
 
 
 def _create_stream(client, log_group, log_stream):
-    """Create a CloudWatch log stream. Best-effort, never raises."""
+    """Create a CloudWatch log stream once per run. Best-effort, never raises."""
+    if log_stream in _created_streams:
+        return
     with contextlib.suppress(Exception):
-        client.create_log_stream(logGroupName=log_group, logStreamName=log_stream)
+        with contextlib.suppress(client.exceptions.ResourceAlreadyExistsException):
+            client.create_log_stream(logGroupName=log_group, logStreamName=log_stream)
+        _created_streams.add(log_stream)
 
 
 def _flush(client, log_group, log_stream, events):
-    """Send a batch of events to CloudWatch Logs. Best-effort, never raises."""
-    with contextlib.suppress(Exception):
+    """Send a batch of (timestamp, message) events to CloudWatch Logs. Best-effort, never raises.
+
+    API and connection errors are reported on stderr; the batch is dropped either way.
+    """
+    try:
         client.put_log_events(
             logGroupName=log_group,
             logStreamName=log_stream,
-            logEvents=events,
+            logEvents=[{"timestamp": timestamp, "message": message} for timestamp, message in events],
         )
+    except (ClientError, EndpointConnectionError) as e:
+        print(f"cloudwatch_logger: dropped {len(events)} event(s) for {log_stream}: {e}", file=sys.stderr)
+    except Exception:
+        pass
 
 
 if __name__ == "__main__":
@@ -13,12 +13,43 @@ Usage:
 import argparse
 import json
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import boto3
 import yaml
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared client configuration: adaptive retries absorb throttling, and the pool
+# is sized above the executor's worker count so threads never wait on a socket
+BOTO_CONFIG = Config(
+    retries={"max_attempts": 5, "mode": "adaptive"},
+    max_pool_connections=32,
+    connect_timeout=3,
+    read_timeout=10,
+)
+
+# Assumed-role sessions keyed by (account_id, region), reused for the process lifetime
+_assumed_sessions: dict[tuple[str, str], boto3.Session] = {}
+
+# One lock per (account_id, region) so each role is assumed once without
+# holding up client creation or other keys during the STS call
+_assume_locks: dict[tuple[str, str], threading.Lock] = {}
+_assume_locks_guard = threading.Lock()
+
+# boto3 sessions are not thread-safe; client creation is serialized
+_session_lock = threading.Lock()
+
+# Shared pool for independent AWS API calls (clients themselves are thread-safe)
+_executor = ThreadPoolExecutor(max_workers=8)
+
 
 def load_config() -> dict:
     """Load configuration from config.yaml."""
@@ -34,7 +65,55 @@ def load_config() -> dict:
         return yaml.safe_load(f)
 
 
-def discover_macie_org_config(primary_region: str, audit_account_id: str) -> dict:
+def dump_json(data: dict) -> str:
+    """Serialize data as JSON indented by 2 spaces, using orjson when installed.
+
+    Non-string keys (e.g. numeric tag keys from config.yaml) are stringified,
+    matching stdlib json.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, indent=2)
+
+
+def get_client(session: boto3.Session, service: str, region: str | None = None):
+    """Create a boto3 client from a shared session, safe to call from worker threads."""
+    with _session_lock:
+        return session.client(service, region_name=region, config=BOTO_CONFIG)
+
+
+def get_audit_session(session: boto3.Session, audit_account_id: str, region: str, role: str) -> boto3.Session:
+    """Assume a role in the audit account and return a session for it.
+
+    The role is assumed at most once per (account, region); subsequent calls
+    return the cached session so Macie and S3 lookups share one STS round-trip.
+    """
+    key = (audit_account_id, region)
+    with _assume_locks_guard:
+        assume_lock = _assume_locks.setdefault(key, threading.Lock())
+
+    with assume_lock:
+        if key not in _assumed_sessions:
+            assumed = get_client(session, "sts", region).assume_role(
+                RoleArn=f"arn:aws:iam::{audit_account_id}:role/{role}",
+                RoleSessionName="macie-discovery",
+            )
+            creds = assumed["Credentials"]
+            _assumed_sessions[key] = boto3.Session(
+                aws_access_key_id=creds["AccessKeyId"],
+                aws_secret_access_key=creds["SecretAccessKey"],
+                aws_session_token=creds["SessionToken"],
+                region_name=region,
+            )
+        return _assumed_sessions[key]
+
+
+def discover_macie_org_config(
+    session: boto3.Session,
+    primary_region: str,
+    audit_account_id: str,
+    audit_account_role: str,
+) -> dict:
     """Discover existing Macie organization configuration.
 
     Returns information about Macie organization status:
@@ -50,7 +129,7 @@ def discover_macie_org_config(primary_region: str, audit_account_id: str) -> dic
     }
 
     try:
-        org_client = boto3.client("organizations", region_name=primary_region)
+        org_client = get_client(session, "organizations", primary_region)
         try:
             response = org_client.list_delegated_administrators(ServicePrincipal="macie.amazonaws.com")
             admins = response.get("DelegatedAdministrators", [])
@@ -61,26 +140,20 @@ def discover_macie_org_config(primary_region: str, audit_account_id: str) -> dic
 
                 if result["macie_delegated_admin"] == audit_account_id:
                     try:
-                        sts_client = boto3.client("sts", region_name=primary_region)
-                        assumed = sts_client.assume_role(
-                            RoleArn=f"arn:aws:iam::{audit_account_id}:role/OrganizationAccountAccessRole",
-                            RoleSessionName="macie-discovery",
-                        )
-                        creds = assumed["Credentials"]
-                        audit_macie = boto3.client(
-                            "macie2",
-                            region_name=primary_region,
-                            aws_access_key_id=creds["AccessKeyId"],
-                            aws_secret_access_key=creds["SecretAccessKey"],
-                            aws_session_token=creds["SessionToken"],
-                        )
-
-                        macie_status = audit_macie.get_macie_session()
+                        audit_session = get_audit_session(session, audit_account_id, primary_region, audit_account_role)
+                        audit_macie = get_client(audit_session, "macie2")
+
+                        # Independent read-only lookups against the same client
+                        status_future = _executor.submit(audit_macie.get_macie_session)
+                        org_config_future = _executor.submit(audit_macie.describe_organization_configuration)
+                        discovery_future = _executor.submit(audit_macie.get_automated_discovery_configuration)
+
+                        macie_status = status_future.result()
                         if macie_status.get("status") == "ENABLED":
                             print("    Macie enabled in audit account")
 
                         try:
-                            org_config = audit_macie.describe_organization_configuration()
+                            org_config = org_config_future.result()
                             result["macie_auto_enable"] = org_config.get("autoEnable", False)
                             if result["macie_auto_enable"]:
                                 print("    Auto-enable: ALL")
@@ -90,7 +163,7 @@ def discover_macie_org_config(primary_region: str, audit_account_id: str) -> dic
                             print("    Warning: Could not check org configuration")
 
                         try:
-                            discovery_config = audit_macie.get_automated_discovery_configuration()
+                            discovery_config = discovery_future.result()
                             result["macie_automated_discovery"] = discovery_config.get("status") == "ENABLED"
                             if result["macie_automated_discovery"]:
                                 print("    Automated discovery: ENABLED")
@@ -113,14 +186,39 @@ def discover_macie_org_config(primary_region: str, audit_account_id: str) -> dic
     return result
 
 
-def read_ssm_org_config(resource_prefix: str, region: str) -> dict:
+def check_access_logs_bucket(
+    session: boto3.Session,
+    bucket_name: str,
+    audit_account_id: str,
+    region: str,
+    audit_account_role: str,
+) -> dict:
+    """Check whether the org-baseline access logs bucket exists in the audit account.
+
+    Does not print, so it can run alongside other discovery steps.
+    """
+    result = {"exists": False, "error_code": None, "error": None}
+
+    try:
+        audit_session = get_audit_session(session, audit_account_id, region, audit_account_role)
+        s3_client = get_client(audit_session, "s3")
+        s3_client.head_bucket(Bucket=bucket_name)
+        result["exists"] = True
+    except ClientError as e:
+        result["error_code"] = e.response["Error"]["Code"]
+        result["error"] = str(e)
+
+    return result
+
+
+def read_ssm_org_config(session: boto3.Session, resource_prefix: str, region: str) -> dict:
     """Read org-baseline configuration from SSM Parameter Store.
 
     Returns the parsed JSON config dict, or empty dict if unavailable.
     """
     ssm_path = f"/{resource_prefix}/org-baseline/config"
     try:
-        ssm = boto3.client("ssm", region_name=region)
+        ssm = get_client(session, "ssm", region)
         response = ssm.get_parameter(Name=ssm_path, WithDecryption=True)
         value = json.loads(response["Parameter"]["Value"])
         print(f"SSM Parameter: {ssm_path}")
@@ -169,14 +267,16 @@ def main():
         print("Error: resource_prefix is required in config.yaml")
         return 1
 
-    # Get caller identity (needed before SSM call to determine region)
-    initial_region = config.get("primary_region", "us-east-1")
-    sts = boto3.client("sts", region_name=initial_region)
-    identity = sts.get_caller_identity()
-    management_account_id = identity["Account"]
+    # Single base session shared by all management account clients
+    session = boto3.Session()
 
-    # Read org-baseline config from SSM Parameter Store
-    ssm_config = read_ssm_org_config(resource_prefix, initial_region)
+    # Get caller identity and read org-baseline config from SSM Parameter Store
+    # concurrently (both use the initial region, neither depends on the other)
+    initial_region = config.get("primary_region", "us-east-1")
+    sts = get_client(session, "sts", initial_region)
+    identity_future = _executor.submit(sts.get_caller_identity)
+    ssm_config = read_ssm_org_config(session, resource_prefix, initial_region)
+    management_account_id = identity_future.result()["Account"]
 
     # Merge: SSM values take precedence, config.yaml provides overrides/fallbacks
     primary_region = config.get("primary_region") or ssm_config.get("primary_region", "us-east-1")
@@ -206,40 +306,34 @@ def main():
         print("This project requires portfolio-aws-org-baseline to be deployed first.")
         return 1
 
-    macie_info = discover_macie_org_config(primary_region, audit_account_id)
+    # Check for access logs bucket in audit account (created by org-baseline)
+    # in the background while the Macie organization is discovered
+    access_logs_bucket_name = f"{resource_prefix}-s3-access-logs-{audit_account_id}"
+    bucket_future = _executor.submit(
+        check_access_logs_bucket,
+        session,
+        access_logs_bucket_name,
+        audit_account_id,
+        primary_region,
+        audit_account_role,
+    )
+
+    macie_info = discover_macie_org_config(session, primary_region, audit_account_id, audit_account_role)
     discovery.update(macie_info)
     print("")
 
-    # Check for access logs bucket in audit account (created by org-baseline)
-    access_logs_bucket_exists = False
-    access_logs_bucket_name = f"{resource_prefix}-s3-access-logs-{audit_account_id}"
+    bucket_result = bucket_future.result()
+    access_logs_bucket_exists = bucket_result["exists"]
     print("Access Logs Bucket:")
-    try:
-        sts_client = boto3.client("sts", region_name=primary_region)
-        assumed = sts_client.assume_role(
-            RoleArn=f"arn:aws:iam::{audit_account_id}:role/{audit_account_role}",
-            RoleSessionName="macie-discovery-s3",
-        )
-        creds = assumed["Credentials"]
-        s3_client = boto3.client(
-            "s3",
-            region_name=primary_region,
-            aws_access_key_id=creds["AccessKeyId"],
-            aws_secret_access_key=creds["SecretAccessKey"],
-            aws_session_token=creds["SessionToken"],
-        )
-        s3_client.head_bucket(Bucket=access_logs_bucket_name)
-        access_logs_bucket_exists = True
+    if access_logs_bucket_exists:
         print(f"    {access_logs_bucket_name} exists")
-    except ClientError as e:
-        error_code = e.response["Error"]["Code"]
-        if error_code in ("404", "NoSuchBucket"):
-            print(f"    WARNING: {access_logs_bucket_name} not found")
-            print("    Findings bucket will be created without access logging")
-            print("    Deploy portfolio-aws-org-baseline first to create the access logs bucket")
-        else:
-            print(f"    WARNING: Could not check bucket: {e}")
-            print("    Findings bucket will be created without access logging")
+    elif bucket_result["error_code"] in ("404", "NoSuchBucket"):
+        print(f"    WARNING: {access_logs_bucket_name} not found")
+        print("    Findings bucket will be created without access logging")
+        print("    Deploy portfolio-aws-org-baseline first to create the access logs bucket")
+    else:
+        print(f"    WARNING: Could not check bucket: {bucket_result['error']}")
+        print("    Findings bucket will be created without access logging")
     print("")
 
     # Build output data
@@ -267,16 +361,16 @@ def main():
     if dry_run:
         print("DRY RUN: Would write the following files:")
         print(f"\n  {discovery_path}:")
-        print(json.dumps(discovery, indent=2, default=str))
+        print(dump_json(discovery))
         print(f"\n  {tfvars_path}:")
-        print(json.dumps(tfvars, indent=2))
+        print(dump_json(tfvars))
     else:
         with open(discovery_path, "w") as f:
-            json.dump(discovery, f, indent=2, default=str)
+            f.write(dump_json(discovery))
         print(f"Discovery output written to {discovery_path}")
 
         with open(tfvars_path, "w") as f:
-            json.dump(tfvars, f, indent=2)
+            f.write(dump_json(tfvars))
         print(f"Terraform variables written to {tfvars_path}")
 
     print("")
@@ -11,10 +11,14 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import subprocess
 import sys
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import boto3
@@ -24,6 +28,9 @@ from botocore.exceptions import ClientError
 IMPORT_RETRIES = 2
 IMPORT_RETRY_DELAY = 5
 
+# boto3 sessions are not thread-safe; client creation is serialized
+_client_lock = threading.Lock()
+
 
 def run_terraform_cmd(args: list, timeout: int = 120) -> tuple:
     """Run a terraform command and return (success, output)."""
@@ -44,12 +51,37 @@ def run_terraform_cmd(args: list, timeout: int = 120) -> tuple:
         return False, str(e)
 
 
+def stream_terraform_cmd(args: list, stderr: bool = False, timeout: int = 120) -> Iterator[str]:
+    """Run a terraform command and yield its stdout (or stderr) line by line.
+
+    The other stream is discarded rather than buffered in memory. Raises
+    subprocess.CalledProcessError on a non-zero exit; the process is killed
+    if it runs longer than timeout seconds.
+    """
+    cmd = ["terraform"] + args
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL if stderr else subprocess.PIPE,
+        stderr=subprocess.PIPE if stderr else subprocess.DEVNULL,
+        text=True,
+        cwd="/work/terraform",
+    ) as proc:
+        timer = threading.Timer(timeout, proc.kill)
+        timer.start()
+        try:
+            yield from proc.stderr if stderr else proc.stdout
+        finally:
+            timer.cancel()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
 def get_state_resources() -> set:
     """Get set of all resource addresses in current Terraform state."""
-    success, output = run_terraform_cmd(["state", "list"])
-    if success:
-        return set(output.strip().split("\n")) if output.strip() else set()
-    return set()
+    try:
+        return {address for line in stream_terraform_cmd(["state", "list"]) if (address := line.strip())}
+    except (OSError, subprocess.SubprocessError):
+        return set()
 
 
 def resource_exists_in_state(address: str, state_resources: set) -> bool:
@@ -79,9 +111,24 @@ def import_resource(address: str, resource_id: str, dry_run: bool = False) -> bo
     return False
 
 
-def get_account_ids_from_tfvars() -> dict:
-    """Get account IDs from discovery.json and bootstrap.auto.tfvars.json."""
-    result = {"management": "", "audit": ""}
+def load_tfvars() -> dict:
+    """Load bootstrap.auto.tfvars.json written by discover.py.
+
+    Returns an empty dict if the file is missing or unreadable.
+    """
+    tfvars_path = Path("/work/terraform/bootstrap.auto.tfvars.json")
+    if tfvars_path.exists():
+        try:
+            with open(tfvars_path) as f:
+                return json.load(f)
+        except Exception:
+            pass
+    return {}
+
+
+def get_account_ids_from_tfvars(tfvars: dict) -> dict:
+    """Get account IDs from discovery.json and the loaded bootstrap tfvars."""
+    result = {"management": "", "audit": tfvars.get("audit_account_id", "")}
 
     discovery_path = Path("/work/terraform/discovery.json")
     if discovery_path.exists():
@@ -92,200 +139,224 @@ def get_account_ids_from_tfvars() -> dict:
         except Exception:
             pass
 
-    tfvars_path = Path("/work/terraform/bootstrap.auto.tfvars.json")
-    if tfvars_path.exists():
-        try:
-            with open(tfvars_path) as f:
-                tfvars = json.load(f)
-            result["audit"] = tfvars.get("audit_account_id", "")
-        except Exception:
-            pass
-
     return result
 
 
-def get_cross_account_session(account_id: str, region: str):
-    """Get boto3 session for cross-account access via OrganizationAccountAccessRole."""
-    sts = boto3.client("sts", region_name=region)
-    try:
-        response = sts.assume_role(
-            RoleArn=f"arn:aws:iam::{account_id}:role/OrganizationAccountAccessRole",
-            RoleSessionName="state-sync",
-        )
-        credentials = response["Credentials"]
-        return boto3.Session(
-            aws_access_key_id=credentials["AccessKeyId"],
-            aws_secret_access_key=credentials["SecretAccessKey"],
-            aws_session_token=credentials["SessionToken"],
-            region_name=region,
-        )
-    except ClientError as e:
-        print(f"    Failed to assume role into {account_id}: {e}")
-        return None
+def get_client(session: boto3.Session | None, service: str, region: str | None = None):
+    """Create a boto3 client from session (or the default session), safe to call from worker threads."""
+    with _client_lock:
+        return (session or boto3).client(service, region_name=region)
+
+
+@functools.cache
+def get_cross_account_session(account_id: str, region: str) -> boto3.Session:
+    """Get boto3 session for cross-account access via OrganizationAccountAccessRole.
+
+    Cached per (account_id, region) so the role is assumed at most once per run.
+    Raises ClientError if the role cannot be assumed.
+    """
+    sts = get_client(None, "sts", region)
+    response = sts.assume_role(
+        RoleArn=f"arn:aws:iam::{account_id}:role/OrganizationAccountAccessRole",
+        RoleSessionName="state-sync",
+    )
+    credentials = response["Credentials"]
+    return boto3.Session(
+        aws_access_key_id=credentials["AccessKeyId"],
+        aws_secret_access_key=credentials["SecretAccessKey"],
+        aws_session_token=credentials["SessionToken"],
+        region_name=region,
+    )
 
 
 def warm_up_providers():
     """Run terraform refresh to initialize all provider credentials."""
     print("\n=== Warming Up Terraform Providers ===\n")
-    success, output = run_terraform_cmd(
-        ["plan", "-refresh-only", "-input=false", "-compact-warnings"],
-        timeout=300,
-    )
+    # Plan output on stdout is discarded; only the first few error lines are kept
+    error_lines = []
+    try:
+        for line in stream_terraform_cmd(
+            ["plan", "-refresh-only", "-input=false", "-compact-warnings"],
+            stderr=True,
+            timeout=300,
+        ):
+            if len(error_lines) < 5 and "error" in line.lower():
+                error_lines.append(line)
+        success = True
+    except (OSError, subprocess.SubprocessError):
+        success = False
+
     if success:
         print("  Provider initialization successful")
     else:
-        error_lines = [line for line in output.split("\n") if "error" in line.lower() or "Error" in line]
         if error_lines:
             print("  Provider initialization warnings:")
-            for line in error_lines[:5]:
+            for line in error_lines:
                 print(f"    {line.strip()}")
         else:
             print("  Provider initialization completed with warnings")
 
 
-def sync_cloudwatch_log_group(state_resources: set, dry_run: bool = False):
-    """Sync CloudWatch log group into Terraform state.
+def new_import_plan(title: str, address: str) -> dict:
+    """Return an empty import plan for one Terraform resource.
+
+    Plans are built by the plan_* functions, which only query AWS and never
+    print, so they can run concurrently. apply_import_plan() then prints the
+    findings and runs the import (if any) in a fixed order.
+    """
+    return {
+        "title": title,
+        "address": address,
+        "description": address,
+        "resource_id": None,
+        "messages": [],
+    }
+
+
+def plan_cloudwatch_log_group(state_resources: set, tfvars: dict) -> dict:
+    """Plan the CloudWatch log group import.
 
     The log group is pre-created by entrypoint.sh (via aws logs create-log-group)
     before Terraform runs to allow immediate logging. Terraform is the source of
     truth for retention, KMS encryption, and tags.
     """
-    print("\n=== Syncing CloudWatch Log Group ===\n")
-
-    tf_address = "aws_cloudwatch_log_group.deployments"
-
-    if resource_exists_in_state(tf_address, state_resources):
-        print("  Already in state, skipping")
-        return
+    plan = new_import_plan("Syncing CloudWatch Log Group", "aws_cloudwatch_log_group.deployments")
 
-    tfvars_path = Path("/work/terraform/bootstrap.auto.tfvars.json")
-    if not tfvars_path.exists():
-        print("  No tfvars found, skipping")
-        return
+    if resource_exists_in_state(plan["address"], state_resources):
+        plan["messages"].append("Already in state, skipping")
+        return plan
 
-    with open(tfvars_path) as f:
-        tfvars = json.load(f)
+    if not tfvars:
+        plan["messages"].append("No tfvars found, skipping")
+        return plan
 
     resource_prefix = tfvars.get("resource_prefix", "")
     deployment_name = tfvars.get("deployment_name", "")
     if not resource_prefix or not deployment_name:
-        print("  Missing resource_prefix or deployment_name, skipping")
-        return
+        plan["messages"].append("Missing resource_prefix or deployment_name, skipping")
+        return plan
 
     log_group_name = f"/{resource_prefix}/deployments/{deployment_name}"
+    plan["resource_id"] = log_group_name
+    plan["description"] = f"{plan['address']} ({log_group_name})"
+    return plan
 
-    print(f"  Importing {tf_address} ({log_group_name})...")
-    if import_resource(tf_address, log_group_name, dry_run=dry_run):
-        if not dry_run:
-            print("    Imported successfully")
-    else:
-        print("    Import failed (will be retried on next run)")
 
+def plan_macie_management_account(state_resources: set, primary_region: str) -> dict:
+    """Plan the Macie management account enablement import."""
+    plan = new_import_plan(
+        "Syncing Macie Management Account",
+        "module.macie_org[0].aws_macie2_account.management",
+    )
 
-def sync_macie_management_account(state_resources: set, primary_region: str, dry_run: bool = False):
-    """Sync Macie management account enablement into Terraform state."""
-    print("\n=== Syncing Macie Management Account ===\n")
-
-    tf_address = "module.macie_org[0].aws_macie2_account.management"
-
-    if resource_exists_in_state(tf_address, state_resources):
-        print("  Already in state, skipping")
-        return
+    if resource_exists_in_state(plan["address"], state_resources):
+        plan["messages"].append("Already in state, skipping")
+        return plan
 
     # Check if Macie is enabled in the management account
     try:
-        macie_client = boto3.client("macie2", region_name=primary_region)
+        macie_client = get_client(None, "macie2", primary_region)
         session = macie_client.get_macie_session()
         if session.get("status") == "ENABLED":
-            print(f"  Importing {tf_address}...")
-            if import_resource(tf_address, "macie", dry_run=dry_run):
-                if not dry_run:
-                    print("    Imported successfully")
-            else:
-                print("    Import failed (will be retried on next run)")
+            plan["resource_id"] = "macie"
         else:
-            print("  Macie not enabled in management account, skipping")
+            plan["messages"].append("Macie not enabled in management account, skipping")
     except ClientError as e:
         if "Macie is not enabled" in str(e):
-            print("  Macie not enabled in management account, skipping")
+            plan["messages"].append("Macie not enabled in management account, skipping")
         else:
-            print(f"  Error checking Macie status: {e}")
+            plan["messages"].append(f"Error checking Macie status: {e}")
 
+    return plan
 
-def sync_macie_org_admin(state_resources: set, primary_region: str, dry_run: bool = False):
-    """Sync Macie delegated administrator into Terraform state."""
-    print("\n=== Syncing Macie Delegated Admin ===\n")
 
-    account_ids = get_account_ids_from_tfvars()
+def plan_macie_org_admin(state_resources: set, primary_region: str, account_ids: dict) -> dict:
+    """Plan the Macie delegated administrator import."""
+    plan = new_import_plan(
+        "Syncing Macie Delegated Admin",
+        "module.macie_org[0].aws_macie2_organization_admin_account.main",
+    )
 
     if not account_ids["audit"]:
-        print("  No audit account ID found, skipping")
-        return
+        plan["messages"].append("No audit account ID found, skipping")
+        return plan
 
     audit_account_id = account_ids["audit"]
-    tf_address = "module.macie_org[0].aws_macie2_organization_admin_account.main"
 
-    if resource_exists_in_state(tf_address, state_resources):
-        print("  Already in state, skipping")
-        return
+    if resource_exists_in_state(plan["address"], state_resources):
+        plan["messages"].append("Already in state, skipping")
+        return plan
 
     try:
-        org_client = boto3.client("organizations", region_name=primary_region)
+        org_client = get_client(None, "organizations", primary_region)
         response = org_client.list_delegated_administrators(ServicePrincipal="macie.amazonaws.com")
         admins = response.get("DelegatedAdministrators", [])
         is_delegated_admin = any(a["Id"] == audit_account_id for a in admins)
 
         if is_delegated_admin:
-            print(f"  Importing {tf_address}...")
-            if import_resource(tf_address, audit_account_id, dry_run=dry_run):
-                if not dry_run:
-                    print("    Imported successfully")
-            else:
-                print("    Import failed")
+            plan["resource_id"] = audit_account_id
         else:
-            print("  Delegated admin not configured, skipping")
+            plan["messages"].append("Delegated admin not configured, skipping")
     except ClientError as e:
-        print(f"  Error checking delegated admin: {e}")
+        plan["messages"].append(f"Error checking delegated admin: {e}")
 
+    return plan
 
-def sync_macie_audit_account(state_resources: set, primary_region: str, dry_run: bool = False):
-    """Sync Macie audit account enablement into Terraform state."""
-    print("\n=== Syncing Macie Audit Account ===\n")
 
-    account_ids = get_account_ids_from_tfvars()
+def plan_macie_audit_account(state_resources: set, primary_region: str, account_ids: dict) -> dict:
+    """Plan the Macie audit account enablement import."""
+    plan = new_import_plan(
+        "Syncing Macie Audit Account",
+        "module.macie_config[0].aws_macie2_account.audit",
+    )
 
     if not account_ids["audit"]:
-        print("  No audit account ID found, skipping")
-        return
-
-    tf_address = "module.macie_config[0].aws_macie2_account.audit"
+        plan["messages"].append("No audit account ID found, skipping")
+        return plan
 
-    if resource_exists_in_state(tf_address, state_resources):
-        print("  Already in state, skipping")
-        return
+    if resource_exists_in_state(plan["address"], state_resources):
+        plan["messages"].append("Already in state, skipping")
+        return plan
 
-    session = get_cross_account_session(account_ids["audit"], primary_region)
-    if not session:
-        print("  Could not assume role into audit account, skipping")
-        return
+    try:
+        session = get_cross_account_session(account_ids["audit"], primary_region)
+    except ClientError as e:
+        plan["messages"].append(f"Failed to assume role into {account_ids['audit']}: {e}")
+        plan["messages"].append("Could not assume role into audit account, skipping")
+        return plan
 
     try:
-        macie_client = session.client("macie2")
+        macie_client = get_client(session, "macie2", primary_region)
         macie_session = macie_client.get_macie_session()
         if macie_session.get("status") == "ENABLED":
-            print(f"  Importing {tf_address}...")
-            if import_resource(tf_address, "macie", dry_run=dry_run):
-                if not dry_run:
-                    print("    Imported successfully")
-            else:
-                print("    Import failed (will be retried on next run)")
+            plan["resource_id"] = "macie"
         else:
-            print("  Macie not enabled in audit account, skipping")
+            plan["messages"].append("Macie not enabled in audit account, skipping")
     except ClientError as e:
         if "Macie is not enabled" in str(e):
-            print("  Macie not enabled in audit account, skipping")
+            plan["messages"].append("Macie not enabled in audit account, skipping")
         else:
-            print(f"  Error checking Macie status: {e}")
+            plan["messages"].append(f"Error checking Macie status: {e}")
+
+    return plan
+
+
+def apply_import_plan(plan: dict, dry_run: bool = False):
+    """Print an import plan's findings and import its resource, if any."""
+    print(f"\n=== {plan['title']} ===\n")
+
+    for message in plan["messages"]:
+        print(f"  {message}")
+
+    if plan["resource_id"] is None:
+        return
+
+    print(f"  Importing {plan['description']}...")
+    if import_resource(plan["address"], plan["resource_id"], dry_run=dry_run):
+        if not dry_run:
+            print("    Imported successfully")
+    else:
+        print("    Import failed (will be retried on next run)")
 
 
 def parse_args() -> argparse.Namespace:
@@ -312,35 +383,38 @@ def main():
     print("=" * 50)
     print("")
 
-    # Load config
-    config_path = Path("/work/config.yaml")
-    if not config_path.exists():
-        config_path = Path(__file__).parent.parent / "config.yaml"
-
-    with open(config_path) as f:
-        config = json.load(f) if str(config_path).endswith(".json") else __import__("yaml").safe_load(f)
-
-    primary_region = config.get("primary_region", "us-east-1")
+    # Load discovery output once and share it across all syncers. discover.py
+    # has already resolved primary_region from config.yaml and SSM.
+    tfvars = load_tfvars()
+    account_ids = get_account_ids_from_tfvars(tfvars)
+    primary_region = tfvars.get("primary_region", "us-east-1")
 
     # Get current Terraform state
     state_resources = get_state_resources()
     print(f"  Current state has {len(state_resources)} resources")
 
-    # Warm up providers on empty state (skip in dry-run since no imports will happen)
-    if len(state_resources) == 0 and not dry_run:
-        warm_up_providers()
-
-    # Sync CloudWatch log group (pre-created by entrypoint.sh before Terraform)
-    sync_cloudwatch_log_group(state_resources, dry_run=dry_run)
-
-    # Sync Macie management account enablement
-    sync_macie_management_account(state_resources, primary_region, dry_run=dry_run)
-
-    # Sync Macie delegated admin
-    sync_macie_org_admin(state_resources, primary_region, dry_run=dry_run)
-
-    # Sync Macie audit account enablement
-    sync_macie_audit_account(state_resources, primary_region, dry_run=dry_run)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # Check AWS for every resource concurrently, in the background of the
+        # provider warm-up. The checks only read AWS and never print.
+        plan_futures = [
+            # CloudWatch log group (pre-created by entrypoint.sh before Terraform)
+            executor.submit(plan_cloudwatch_log_group, state_resources, tfvars),
+            # Macie management account enablement
+            executor.submit(plan_macie_management_account, state_resources, primary_region),
+            # Macie delegated admin
+            executor.submit(plan_macie_org_admin, state_resources, primary_region, account_ids),
+            # Macie audit account enablement
+            executor.submit(plan_macie_audit_account, state_resources, primary_region, account_ids),
+        ]
+
+        # Warm up providers on empty state (skip in dry-run since no imports will happen)
+        if len(state_resources) == 0 and not dry_run:
+            warm_up_providers()
+
+    # Imports run one at a time in a fixed order: concurrent terraform imports
+    # would overwrite each other's state (the S3 backend has no lock table)
+    for future in plan_futures:
+        apply_import_plan(future.result(), dry_run=dry_run)
 
     print("\n" + "=" * 50)
     if dry_run:
@@ -91,6 +91,20 @@ tee_log() {
     fi
 }
 
+# Helper to print a coloured status message to stdout and write the plain
+# text straight to the current CloudWatch log stream. Status messages are not
+# piped through tee_log, and sending them uncoloured leaves the logger no
+# escape codes to strip.
+# Usage: cwlog <color> <message>  (pass "${NC}" for uncoloured lines)
+cwlog() {
+    local color="$1"
+    shift
+    echo -e "${color}$*${NC}"
+    if [ -n "${CW_LOGGER_PID}" ] && kill -0 "${CW_LOGGER_PID}" 2>/dev/null; then
+        printf '%s\n' "$*" >&3
+    fi
+}
+
 # EXIT trap to clean up CloudWatch logger on any exit
 cleanup_logger() {
     local exit_code=$?
@@ -137,13 +151,13 @@ STATE_REGION="${PRIMARY_REGION}"
 # Verify the state bucket exists (created by portfolio-aws-org-baseline)
 echo -e "${YELLOW}Checking Terraform state bucket...${NC}"
 if ! aws s3api head-bucket --bucket "${STATE_BUCKET}" 2>/dev/null; then
-    echo -e "${RED}Error: State bucket '${STATE_BUCKET}' does not exist${NC}"
-    echo "The state bucket must be created by portfolio-aws-org-baseline first."
-    echo "Run 'make apply' in portfolio-aws-org-baseline before deploying Macie."
+    cwlog "${RED}" "Error: State bucket '${STATE_BUCKET}' does not exist"
+    cwlog "${NC}" "The state bucket must be created by portfolio-aws-org-baseline first."
+    cwlog "${NC}" "Run 'make apply' in portfolio-aws-org-baseline before deploying Macie."
     exit 1
 fi
-echo -e "${GREEN}State bucket exists: ${STATE_BUCKET}${NC}"
-echo -e "${GREEN}State key: ${STATE_KEY}${NC}"
+cwlog "${GREEN}" "State bucket exists: ${STATE_BUCKET}"
+cwlog "${GREEN}" "State key: ${STATE_KEY}"
 echo ""
 
 case "$ACTION" in
@@ -277,9 +291,9 @@ if [ "$TF_ACTION" = "apply -auto-approve" ]; then
     python3 /work/post-deployment/verify-macie.py 2>&1 | tee_log "verify" || MACIE_EXIT_CODE=$?
 
     if [ $MACIE_EXIT_CODE -eq 0 ]; then
-        echo -e "${GREEN}Macie organization verification completed successfully${NC}"
+        cwlog "${GREEN}" "Macie organization verification completed successfully"
     else
-        echo -e "${YELLOW}Warning: Macie verification encountered issues (exit code: $MACIE_EXIT_CODE)${NC}"
+        cwlog "${YELLOW}" "Warning: Macie verification encountered issues (exit code: $MACIE_EXIT_CODE)"
     fi
     echo ""
 
@@ -293,7 +307,7 @@ if [ "$TF_ACTION" = "apply -auto-approve" ]; then
             --apply 2>&1 | tee_log "enroll-members" || true
         echo ""
     else
-        echo -e "${YELLOW}Skipping member enrollment (audit account ID not found)${NC}"
+        cwlog "${YELLOW}" "Skipping member enrollment (audit account ID not found)"
     fi
 fi
 
@@ -306,5 +320,5 @@ if [ "$TF_ACTION" = "apply -auto-approve" ]; then
     echo ""
     terraform output -json macie_summary 2>/dev/null | jq . | tee_log "summary" || echo "No summary output available"
     echo ""
-    echo -e "${GREEN}Macie organization deployment complete!${NC}"
+    cwlog "${GREEN}" "Macie organization deployment complete!"
 fi
@@ -16,15 +16,58 @@ Usage:
 
     # Actually enroll accounts
     python3 enroll-macie-members.py --audit-account-id 123456789012 --apply
+
+    # Skip the delegated admin lookup when the account ID is already trusted
+    python3 enroll-macie-members.py --audit-account-id 123456789012 --apply --skip-delegated-admin-check
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
 import sys
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+# boto3 and botocore are imported where they are used, so --help and argument
+# errors return without paying their few hundred milliseconds of import time
+if TYPE_CHECKING:
+    import boto3
+    from botocore.config import Config
+    from botocore.exceptions import ClientError
+
+
+@functools.cache
+def boto_config() -> Config:
+    """Shared client configuration.
+
+    Adaptive retries absorb throttling from the concurrent calls, and the
+    pool is sized above the worker count.
+    """
+    from botocore.config import Config
+
+    return Config(
+        retries={"max_attempts": 6, "mode": "adaptive"},
+        max_pool_connections=25,
+        connect_timeout=5,
+        read_timeout=30,
+    )
+
 
-import boto3
-from botocore.exceptions import ClientError
+@functools.cache
+def get_client(service: str, region: str):
+    """Return a client for the current credentials, built once per (service, region)."""
+    import boto3
+
+    return boto3.client(service, region_name=region, config=boto_config())
+
+
+# Reuse assumed-role sessions until shortly before their credentials expire
+CREDENTIAL_EXPIRY_SKEW = timedelta(seconds=300)
+_session_cache: dict[tuple[str, str, str], tuple[boto3.Session, datetime]] = {}
 
 
 def assume_audit_role(
@@ -32,47 +75,60 @@ def assume_audit_role(
     region: str,
     role_name: str = "OrganizationAccountAccessRole",
 ) -> boto3.Session:
-    """Assume role into the audit account and return a session."""
-    sts = boto3.client("sts", region_name=region)
+    """Assume role into the audit account and return a session.
+
+    Sessions are cached per (account, role, region) until their credentials
+    are within CREDENTIAL_EXPIRY_SKEW of expiring.
+    """
+    import boto3
+    from botocore.exceptions import ClientError
+
+    cache_key = (audit_account_id, role_name, region)
+    cached = _session_cache.get(cache_key)
+    if cached and cached[1] - CREDENTIAL_EXPIRY_SKEW > datetime.now(UTC):
+        return cached[0]
+
+    sts = get_client("sts", region)
     role_arn = f"arn:aws:iam::{audit_account_id}:role/{role_name}"
 
     try:
         response = sts.assume_role(RoleArn=role_arn, RoleSessionName="MacieEnrollment")
-        credentials = response["Credentials"]
-        return boto3.Session(
-            aws_access_key_id=credentials["AccessKeyId"],
-            aws_secret_access_key=credentials["SecretAccessKey"],
-            aws_session_token=credentials["SessionToken"],
-            region_name=region,
-        )
     except ClientError as e:
         print(f"Error assuming role {role_arn}: {e}", file=sys.stderr)
         sys.exit(1)
 
+    credentials = response["Credentials"]
+    session = boto3.Session(
+        aws_access_key_id=credentials["AccessKeyId"],
+        aws_secret_access_key=credentials["SecretAccessKey"],
+        aws_session_token=credentials["SessionToken"],
+        region_name=region,
+    )
+    _session_cache[cache_key] = (session, credentials["Expiration"])
+    return session
+
 
-def get_organization_accounts() -> list[dict]:
-    """Get all active accounts in the organization."""
-    org_client = boto3.client("organizations", region_name="us-east-1")
-    accounts = []
+def get_organization_accounts() -> Iterator[dict]:
+    """Yield all active accounts in the organization, page by page."""
+    org_client = get_client("organizations", "us-east-1")
 
     paginator = org_client.get_paginator("list_accounts")
-    for page in paginator.paginate():
+    # 20 is the ListAccounts maximum page size
+    for page in paginator.paginate(PaginationConfig={"PageSize": 20}):
         for account in page["Accounts"]:
             if account["Status"] == "ACTIVE":
-                accounts.append(
-                    {
-                        "id": account["Id"],
-                        "name": account["Name"],
-                        "email": account["Email"],
-                    }
-                )
-
-    return accounts
+                yield {
+                    "id": account["Id"],
+                    "name": account["Name"],
+                    "email": account["Email"],
+                }
 
 
 def get_macie_delegated_admin(region: str) -> str | None:
     """Get the Macie delegated admin account ID via Organizations API."""
-    org_client = boto3.client("organizations", region_name=region)
+    from botocore.exceptions import ClientError
+
+    org_client = get_client("organizations", region)
 
     try:
         response = org_client.list_delegated_administrators(ServicePrincipal="macie.amazonaws.com")
@@ -85,33 +141,54 @@ def get_macie_delegated_admin(region: str) -> str | None:
         return None
 
 
-def get_macie_members(session: boto3.Session, region: str) -> dict[str, str]:
-    """Get accounts already associated with Macie and their relationship status.
+# Error codes Macie returns when it is not enabled for the calling account and
+# region. The message text is only consulted as a fallback for other codes.
+MACIE_NOT_ENABLED_CODES = frozenset({"AccessDeniedException", "ResourceNotFoundException"})
+
+
+def is_macie_not_enabled(error: ClientError) -> bool:
+    """Return True if a Macie ClientError means Macie is not enabled."""
+    if error.response.get("Error", {}).get("Code") in MACIE_NOT_ENABLED_CODES:
+        return True
+    return "not enabled" in str(error).lower()
+
+
+def iter_macie_members(session: boto3.Session, region: str) -> Iterator[tuple[str, str]]:
+    """Yield (account_id, relationshipStatus) for accounts known to Macie.
 
-    Returns a dict mapping account_id to relationshipStatus.
     Uses onlyAssociated=False to include all accounts (not just active members).
+    Members are yielded page by page rather than collected first.
     """
-    macie_client = session.client("macie2", region_name=region)
-    members = {}
+    from botocore.exceptions import ClientError
+
+    macie_client = session.client("macie2", region_name=region, config=boto_config())
 
     try:
         paginator = macie_client.get_paginator("list_members")
         for page in paginator.paginate(onlyAssociated="false"):
             for member in page.get("members", []):
-                members[member["accountId"]] = member.get("relationshipStatus", "Unknown")
+                yield member["accountId"], member.get("relationshipStatus", "Unknown")
     except ClientError as e:
-        if "not enabled" in str(e).lower():
+        if is_macie_not_enabled(e):
             print(f"  ERROR: Macie is not enabled in {region}", file=sys.stderr)
             sys.exit(1)
         print(f"  ERROR: Failed to list Macie members in {region}: {e}", file=sys.stderr)
         sys.exit(1)
 
-    return members
+
+# Concurrent CreateMember calls; kept low to stay under the Macie API rate limit
+MAX_ENROLLMENT_WORKERS = 10
 
 
-def create_member(session: boto3.Session, account_id: str, email: str, region: str) -> bool:
-    """Associate a member account with Macie."""
-    macie_client = session.client("macie2", region_name=region)
+def create_member(macie_client, account_id: str, email: str) -> str | None:
+    """Associate a member account with Macie.
+
+    Returns None on success (including accounts that are already members) or
+    the error message on failure. Safe to call concurrently: boto3 clients are
+    thread-safe, and output is left to the caller so only the main thread
+    writes to stdout.
+    """
+    from botocore.exceptions import ClientError
 
     try:
         macie_client.create_member(
@@ -120,13 +197,12 @@ def create_member(session: boto3.Session, account_id: str, email: str, region: s
                 "email": email,
             }
         )
-        return True
+        return None
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
         if error_code == "ConflictException":
-            return True  # Already a member
-        print(f"    Failed to enroll {account_id}: {e}")
-        return False
+            return None  # Already a member
+        return str(e)
 
 
 def main():
@@ -151,6 +227,11 @@ def main():
         action="store_true",
         help="Actually enroll accounts (default is dry-run)",
     )
+    parser.add_argument(
+        "--skip-delegated-admin-check",
+        action="store_true",
+        help="Skip the Organizations lookup that verifies --audit-account-id is the Macie delegated admin",
+    )
     args = parser.parse_args()
 
     dry_run = not args.apply
@@ -164,20 +245,23 @@ def main():
     print("")
 
     # Get current account
-    sts = boto3.client("sts", region_name=args.region)
+    sts = get_client("sts", args.region)
     current_account = sts.get_caller_identity()["Account"]
     print(f"Management account: {current_account}")
     print(f"Primary region: {args.region}")
 
-    # Verify the delegated admin matches
-    delegated_admin = get_macie_delegated_admin(args.region)
-    if delegated_admin != args.audit_account_id:
-        print("")
-        print("Error: Provided audit account does not match Macie delegated admin.")
-        print(f"  Provided: {args.audit_account_id}")
-        print(f"  Delegated admin: {delegated_admin}")
-        sys.exit(1)
-    print(f"Delegated admin: {delegated_admin}")
+    # Verify the delegated admin matches, unless the caller already trusts it
+    if args.skip_delegated_admin_check:
+        print(f"Delegated admin: {args.audit_account_id} (not verified)")
+    else:
+        delegated_admin = get_macie_delegated_admin(args.region)
+        if delegated_admin != args.audit_account_id:
+            print("")
+            print("Error: Provided audit account does not match Macie delegated admin.")
+            print(f"  Provided: {args.audit_account_id}")
+            print(f"  Delegated admin: {delegated_admin}")
+            sys.exit(1)
+        print(f"Delegated admin: {delegated_admin}")
 
     # Assume role into audit account
     print(f"Assuming {args.role_name} in audit account...")
@@ -187,29 +271,32 @@ def main():
     # Get all org accounts, excluding the audit account (delegated admin cannot
     # be enrolled as a member — AWS rejects it with ValidationException)
     print("Fetching organization accounts...")
-    all_accounts = get_organization_accounts()
-    member_accounts = [a for a in all_accounts if a["id"] != args.audit_account_id]
-    print(f"  Total organization accounts: {len(all_accounts)}")
+    total_accounts = 0
+    member_accounts = []
+    for account in get_organization_accounts():
+        total_accounts += 1
+        if account["id"] != args.audit_account_id:
+            member_accounts.append(account)
+    print(f"  Total organization accounts: {total_accounts}")
     print(f"  Member accounts (excluding delegated admin): {len(member_accounts)}")
     print("")
 
     # Get current Macie members
     print("Checking current Macie member status...")
-    existing_members = get_macie_members(audit_session, args.region)
-
-    # Categorize accounts
-    already_enabled = []
-    needs_enrollment = []
-    other_status = []
-
-    for account in member_accounts:
-        status = existing_members.get(account["id"])
-        if status == "Enabled":
-            already_enabled.append(account)
-        elif status is None:
-            needs_enrollment.append(account)
-        else:
-            other_status.append({**account, "status": status})
+
+    # Group accounts by relationship status in a single pass over the Macie
+    # member list; org accounts that Macie never reports need enrollment
+    unmatched = {a["id"]: a for a in member_accounts}
+    by_status: dict[str, list[dict]] = defaultdict(list)
+
+    for account_id, status in iter_macie_members(audit_session, args.region):
+        account = unmatched.pop(account_id, None)
+        if account is not None:
+            by_status[status].append(account)
+
+    already_enabled = by_status.pop("Enabled", [])
+    needs_enrollment = list(unmatched.values())
+    other_status = [{**a, "status": status} for status, accounts in by_status.items() for a in accounts]
 
     print(f"  Already enrolled: {len(already_enabled)}")
     if other_status:
@@ -234,17 +321,26 @@ def main():
         print("Dry run complete. Use --apply to enroll accounts.")
         return
 
-    # Enroll accounts
+    # Enroll accounts concurrently with one shared client
     print("Enrolling accounts...")
     enrolled = 0
     failed = 0
 
-    for account in needs_enrollment:
-        if create_member(audit_session, account["id"], account["email"], args.region):
-            print(f"  {account['id']} ({account['name']}): enrolled")
-            enrolled += 1
-        else:
-            failed += 1
+    macie_client = audit_session.client("macie2", region_name=args.region, config=boto_config())
+    with ThreadPoolExecutor(max_workers=min(MAX_ENROLLMENT_WORKERS, len(needs_enrollment))) as executor:
+        futures = {
+            executor.submit(create_member, macie_client, account["id"], account["email"]): account
+            for account in needs_enrollment
+        }
+        for future in as_completed(futures):
+            account = futures[future]
+            error = future.result()
+            if error is None:
+                print(f"  {account['id']} ({account['name']}): enrolled")
+                enrolled += 1
+            else:
+                print(f"    Failed to enroll {account['id']}: {error}")
+                failed += 1
 
     # Summary
     print("")
@@ -27,62 +27,141 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import boto3
-from botocore.exceptions import ClientError
+# boto3 and botocore are imported where they are used, so --help and argument
+# errors return without paying their few hundred milliseconds of import time
+if TYPE_CHECKING:
+    import boto3
+    from botocore.config import Config
+    from botocore.exceptions import ClientError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+
+@functools.cache
+def boto_config() -> Config:
+    """Shared client configuration.
+
+    Adaptive retries absorb throttling from the concurrent calls, and the
+    pool is sized above the worker count.
+    """
+    from botocore.config import Config
+
+    return Config(
+        retries={"max_attempts": 6, "mode": "adaptive"},
+        max_pool_connections=25,
+        connect_timeout=5,
+        read_timeout=30,
+    )
+
+
+# Role assumed in target accounts
+ROLE_NAME = "OrganizationAccountAccessRole"
+
+# Reuse assumed-role sessions until shortly before their credentials expire
+CREDENTIAL_EXPIRY_SKEW = timedelta(seconds=300)
+_session_cache: dict[tuple[str, str, str], tuple[boto3.Session, datetime]] = {}
+
+# Shared pool for the independent API calls; threads start on first submit
+_executor = ThreadPoolExecutor(max_workers=6)
+
+# boto3 sessions are not thread-safe; client creation is serialized
+_client_lock = threading.Lock()
+
+
+def load_json(path: Path) -> dict:
+    """Parse a JSON file, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text())
+
+
+@functools.cache
 def load_tfvars() -> dict:
-    """Load config from discovery.json and bootstrap.auto.tfvars.json."""
+    """Load config from discovery.json and bootstrap.auto.tfvars.json.
+
+    Cached: the files are read once per run. Callers must not mutate the result.
+    """
     result = {}
 
     tfvars_path = Path("/work/terraform/bootstrap.auto.tfvars.json")
     if not tfvars_path.exists():
         tfvars_path = Path(__file__).parent.parent / "terraform" / "bootstrap.auto.tfvars.json"
     if tfvars_path.exists():
-        with open(tfvars_path) as f:
-            result.update(json.load(f))
+        result.update(load_json(tfvars_path))
 
     discovery_path = Path("/work/terraform/discovery.json")
     if not discovery_path.exists():
         discovery_path = Path(__file__).parent.parent / "terraform" / "discovery.json"
     if discovery_path.exists():
-        with open(discovery_path) as f:
-            result.update(json.load(f))
+        result.update(load_json(discovery_path))
 
     return result
 
 
 def assume_role(account_id: str, region: str) -> boto3.Session | None:
-    """Assume OrganizationAccountAccessRole in target account."""
-    sts_client = boto3.client("sts", region_name=region)
-    role_arn = f"arn:aws:iam::{account_id}:role/OrganizationAccountAccessRole"
+    """Assume OrganizationAccountAccessRole in target account.
+
+    Sessions are cached per (account, role, region) until their credentials
+    are within CREDENTIAL_EXPIRY_SKEW of expiring. Failures are not cached.
+    """
+    import boto3
+    from botocore.exceptions import ClientError
+
+    cache_key = (account_id, ROLE_NAME, region)
+    cached = _session_cache.get(cache_key)
+    if cached and cached[1] - CREDENTIAL_EXPIRY_SKEW > datetime.now(UTC):
+        return cached[0]
+
+    sts_client = get_client(None, "sts", region)
+    role_arn = f"arn:aws:iam::{account_id}:role/{ROLE_NAME}"
 
     try:
         response = sts_client.assume_role(
             RoleArn=role_arn,
             RoleSessionName="macie-verification",
-            DurationSeconds=900,
-        )
-        credentials = response["Credentials"]
-        return boto3.Session(
-            aws_access_key_id=credentials["AccessKeyId"],
-            aws_secret_access_key=credentials["SecretAccessKey"],
-            aws_session_token=credentials["SessionToken"],
-            region_name=region,
+            DurationSeconds=3600,
         )
     except ClientError:
         return None
 
+    credentials = response["Credentials"]
+    session = boto3.Session(
+        aws_access_key_id=credentials["AccessKeyId"],
+        aws_secret_access_key=credentials["SecretAccessKey"],
+        aws_session_token=credentials["SessionToken"],
+        region_name=region,
+    )
+    _session_cache[cache_key] = (session, credentials["Expiration"])
+    return session
+
+
+def get_client(session: boto3.Session | None, service: str, region: str | None = None):
+    """Create a client from session (or the current credentials), safe to call from worker threads."""
+    import boto3
+
+    with _client_lock:
+        return (session or boto3).client(service, region_name=region, config=boto_config())
+
 
 def check_service_access() -> dict:
     """Check if Macie service access is enabled in Organizations."""
+    from botocore.exceptions import ClientError
+
     result = {"enabled": False, "error": None}
 
-    org_client = boto3.client("organizations", region_name="us-east-1")
+    org_client = get_client(None, "organizations", "us-east-1")
 
     try:
         response = org_client.list_aws_service_access_for_organization()
@@ -96,10 +175,12 @@ def check_service_access() -> dict:
 
 def check_delegated_admin(region: str, expected_admin: str) -> dict:
     """Check delegated admin configuration."""
+    from botocore.exceptions import ClientError
+
     result = {"correct": False, "actual_admin": None, "error": None}
 
     try:
-        org_client = boto3.client("organizations", region_name=region)
+        org_client = get_client(None, "organizations", region)
         response = org_client.list_delegated_administrators(ServicePrincipal="macie.amazonaws.com")
         admins = response.get("DelegatedAdministrators", [])
 
@@ -112,21 +193,30 @@ def check_delegated_admin(region: str, expected_admin: str) -> dict:
     return result
 
 
-def check_macie_enabled(session: boto3.Session, region: str, account_name: str) -> dict:
+# Error codes Macie returns when it is not enabled for the calling account and
+# region. The message text is only consulted as a fallback for other codes.
+MACIE_NOT_ENABLED_CODES = frozenset({"AccessDeniedException", "ResourceNotFoundException"})
+
+
+def is_macie_not_enabled(error: ClientError) -> bool:
+    """Return True if a Macie ClientError means Macie is not enabled."""
+    if error.response.get("Error", {}).get("Code") in MACIE_NOT_ENABLED_CODES:
+        return True
+    return "not enabled" in str(error).lower()
+
+
+def check_macie_enabled(macie_client, account_name: str) -> dict:
     """Check if Macie is enabled in an account."""
-    result = {"enabled": False, "publishing_frequency": None, "error": None}
+    from botocore.exceptions import ClientError
 
-    if session is None:
-        macie_client = boto3.client("macie2", region_name=region)
-    else:
-        macie_client = session.client("macie2", region_name=region)
+    result = {"enabled": False, "publishing_frequency": None, "error": None}
 
     try:
         macie_session = macie_client.get_macie_session()
         result["enabled"] = macie_session.get("status") == "ENABLED"
         result["publishing_frequency"] = macie_session.get("findingPublishingFrequency")
     except ClientError as e:
-        if "Macie is not enabled" in str(e):
+        if is_macie_not_enabled(e):
             result["enabled"] = False
         else:
             result["error"] = str(e)
@@ -134,14 +224,11 @@ def check_macie_enabled(session: boto3.Session, region: str, account_name: str)
     return result
 
 
-def check_org_config(session: boto3.Session, region: str) -> dict:
+def check_org_config(macie_client) -> dict:
     """Check organization configuration from the audit account."""
-    result = {"configured": False, "auto_enable": False, "error": None}
+    from botocore.exceptions import ClientError
 
-    if session is None:
-        macie_client = boto3.client("macie2", region_name=region)
-    else:
-        macie_client = session.client("macie2", region_name=region)
+    result = {"configured": False, "auto_enable": False, "error": None}
 
     try:
         response = macie_client.describe_organization_configuration()
@@ -153,14 +240,11 @@ def check_org_config(session: boto3.Session, region: str) -> dict:
     return result
 
 
-def check_classification_export(session: boto3.Session, region: str) -> dict:
+def check_classification_export(macie_client) -> dict:
     """Check classification export configuration."""
-    result = {"configured": False, "bucket": None, "kms_key": None, "error": None}
+    from botocore.exceptions import ClientError
 
-    if session is None:
-        macie_client = boto3.client("macie2", region_name=region)
-    else:
-        macie_client = session.client("macie2", region_name=region)
+    result = {"configured": False, "bucket": None, "kms_key": None, "error": None}
 
     try:
         response = macie_client.get_classification_export_configuration()
@@ -175,19 +259,16 @@ def check_classification_export(session: boto3.Session, region: str) -> dict:
     return result
 
 
-def enable_automated_discovery(session: boto3.Session, region: str) -> dict:
+def enable_automated_discovery(macie_client) -> dict:
     """Enable automated sensitive data discovery if not already enabled.
 
     Since aws_macie2_automated_discovery_configuration does not exist in
     the Terraform AWS provider yet (open feature request #34938), this
     function handles enablement via the boto3 API as a post-deployment step.
     """
-    result = {"enabled": False, "already_enabled": False, "error": None}
+    from botocore.exceptions import ClientError
 
-    if session is None:
-        macie_client = boto3.client("macie2", region_name=region)
-    else:
-        macie_client = session.client("macie2", region_name=region)
+    result = {"enabled": False, "already_enabled": False, "error": None}
 
     try:
         response = macie_client.get_automated_discovery_configuration()
@@ -196,7 +277,7 @@ def enable_automated_discovery(session: boto3.Session, region: str) -> dict:
             result["already_enabled"] = True
             return result
     except ClientError as e:
-        if "is not enabled" not in str(e).lower():
+        if not is_macie_not_enabled(e):
             result["error"] = str(e)
             return result
 
@@ -209,14 +290,11 @@ def enable_automated_discovery(session: boto3.Session, region: str) -> dict:
     return result
 
 
-def check_automated_discovery(session: boto3.Session, region: str) -> dict:
+def check_automated_discovery(macie_client) -> dict:
     """Check automated sensitive data discovery status (read-only)."""
-    result = {"enabled": False, "error": None}
+    from botocore.exceptions import ClientError
 
-    if session is None:
-        macie_client = boto3.client("macie2", region_name=region)
-    else:
-        macie_client = session.client("macie2", region_name=region)
+    result = {"enabled": False, "error": None}
 
     try:
         response = macie_client.get_automated_discovery_configuration()
@@ -227,39 +305,39 @@ def check_automated_discovery(session: boto3.Session, region: str) -> dict:
     return result
 
 
-def check_classification_jobs(session: boto3.Session, region: str) -> dict:
+# Non-cancelled jobs named ccoe-weekly-<config hash>. Update the prefix here if
+# the Terraform job name changes.
+CCOE_JOB_FILTER = {
+    "includes": [
+        {
+            "comparator": "STARTS_WITH",
+            "key": "name",
+            "values": ["ccoe-weekly-"],
+        }
+    ],
+    "excludes": [
+        {
+            "comparator": "EQ",
+            "key": "jobStatus",
+            "values": ["CANCELLED"],
+        }
+    ],
+}
+
+
+def check_classification_jobs(macie_client) -> dict:
     """Check for an active ccoe-weekly classification job.
 
     Searches for jobs with names starting with 'ccoe-weekly-' and returns
     the first active (non-cancelled) match. The job name includes a config
     hash suffix that changes when the job definition changes.
     """
-    result = {"found": False, "job_name": None, "job_id": None, "status": None, "job_type": None, "error": None}
+    from botocore.exceptions import ClientError
 
-    if session is None:
-        macie_client = boto3.client("macie2", region_name=region)
-    else:
-        macie_client = session.client("macie2", region_name=region)
+    result = {"found": False, "job_name": None, "job_id": None, "status": None, "job_type": None, "error": None}
 
     try:
-        response = macie_client.list_classification_jobs(
-            filterCriteria={
-                "includes": [
-                    {
-                        "comparator": "STARTS_WITH",
-                        "key": "name",
-                        "values": ["ccoe-weekly-"],
-                    }
-                ],
-                "excludes": [
-                    {
-                        "comparator": "EQ",
-                        "key": "jobStatus",
-                        "values": ["CANCELLED"],
-                    }
-                ],
-            }
-        )
+        response = macie_client.list_classification_jobs(filterCriteria=CCOE_JOB_FILTER, maxResults=1)
         items = response.get("items", [])
         if items:
             job = items[0]
@@ -285,6 +363,36 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def print_summary(issues: list[str], warnings: list[str]) -> int:
+    """Print the verification summary and return the exit code."""
+    print("=" * 60)
+    print("  Verification Summary")
+    print("=" * 60)
+    print("")
+
+    if issues:
+        print(f"Issues Found ({len(issues)}):")
+        for issue in issues:
+            print(f"  - {issue}")
+        print("")
+
+    if warnings:
+        print(f"Warnings ({len(warnings)}):")
+        for warning in warnings:
+            print(f"  - {warning}")
+        print("")
+
+    if not issues and not warnings:
+        print("All checks passed! Macie is fully configured.")
+        return 0
+    elif not issues:
+        print("Verification complete with warnings.")
+        return 0
+    else:
+        print("Verification complete with issues that need attention.")
+        return 1
+
+
 def main():
     """Main function."""
     args = parse_args()
@@ -298,6 +406,10 @@ def main():
     print("=" * 60)
     print("")
 
+    # Check 1 needs no configuration, so start it first and let its client
+    # setup and TLS handshake overlap with reading the config files
+    service_future = _executor.submit(check_service_access)
+
     # Load configuration
     print("Loading configuration...")
     tfvars = load_tfvars()
@@ -318,9 +430,14 @@ def main():
     issues = []
     warnings = []
 
+    # Check 2 and the audit role assumption are independent of check 1, so run
+    # them alongside it; results are still reported (and gate later checks) in order
+    admin_future = _executor.submit(check_delegated_admin, primary_region, audit_account_id)
+    audit_session_future = _executor.submit(assume_role, audit_account_id, primary_region)
+
     # Check 1: Service access
     print("Checking Macie service access in Organizations...")
-    service_result = check_service_access()
+    service_result = service_future.result()
     if service_result.get("error"):
         print(f"  ERROR: {service_result['error']}")
         issues.append("Service access check failed")
@@ -331,9 +448,16 @@ def main():
         issues.append("Macie service access not enabled in Organizations")
     print("")
 
+    # Every later check presupposes service access, so stop here without
+    # starting checks 3-7
+    if issues:
+        print("Skipping remaining checks (Macie service access required)")
+        print("")
+        return print_summary(issues, warnings)
+
     # Check 2: Delegated admin
     print("Checking delegated administrator configuration...")
-    admin_result = check_delegated_admin(primary_region, audit_account_id)
+    admin_result = admin_future.result()
     if admin_result.get("error"):
         print(f"  ERROR: {admin_result['error']}")
         issues.append("Delegated admin check failed")
@@ -347,20 +471,52 @@ def main():
         issues.append("No delegated admin configured")
     print("")
 
-    # Check 3: Macie enabled in accounts
+    # The audit role is assumed once; checks 3-7 share this session
+    audit_session = audit_session_future.result()
+
+    # One macie2 client per account for the whole run; clients are thread-safe
+    # and shared by the concurrent checks below
+    management_macie = get_client(None, "macie2", primary_region)
+    audit_macie = get_client(audit_session, "macie2", primary_region)
+
+    # Checks 3-7 are independent reads against the same accounts, so run them
+    # concurrently and report the results in check order
     accounts = [
-        ("Management", management_account_id, None),
-        ("Audit", audit_account_id, audit_account_id),
+        ("Management", management_account_id, management_macie),
+        ("Audit", audit_account_id, audit_macie),
     ]
+    discovery_check = check_automated_discovery if dry_run else enable_automated_discovery
+
+    enabled_futures = {
+        account_name: _executor.submit(check_macie_enabled, macie_client, account_name)
+        for account_name, account_id, macie_client in accounts
+        if account_id
+    }
+    # The organization and export configuration are only readable by the
+    # delegated admin. Skip them only when Check 2 positively showed the audit
+    # account is not the admin; if Check 2 failed, run them and let them report.
+    admin_skip_reason = None
+    if not admin_result.get("error") and not admin_result["correct"]:
+        if admin_result["actual_admin"]:
+            admin_skip_reason = f"Delegated admin is {admin_result['actual_admin']}, not the audit account"
+        else:
+            admin_skip_reason = "No delegated admin configured"
+
+    org_future = export_future = None
+    if admin_skip_reason is None:
+        org_future = _executor.submit(check_org_config, audit_macie)
+        export_future = _executor.submit(check_classification_export, audit_macie)
+    discovery_future = _executor.submit(discovery_check, audit_macie)
+    job_future = _executor.submit(check_classification_jobs, audit_macie)
 
-    for account_name, account_id, assume_account_id in accounts:
+    # Check 3: Macie enabled in accounts
+    for account_name, account_id, _ in accounts:
         if not account_id:
             print(f"Checking {account_name} Macie status... SKIPPED (no account ID)")
             continue
 
         print(f"Checking {account_name} Macie status...")
-        session = assume_role(assume_account_id, primary_region) if assume_account_id else None
-        result = check_macie_enabled(session, primary_region, account_name)
+        result = enabled_futures[account_name].result()
         if result.get("error"):
             print(f"  ERROR: {result['error']}")
             issues.append(f"{account_name}: Macie check failed")
@@ -373,39 +529,44 @@ def main():
 
     # Check 4: Organization auto-enable
     print("Checking organization auto-enable configuration...")
-    audit_session = assume_role(audit_account_id, primary_region)
-    org_result = check_org_config(audit_session, primary_region)
-    if org_result.get("error"):
-        print(f"  ERROR: {org_result['error']}")
-        issues.append("Org configuration check failed")
-    elif org_result["configured"] and org_result["auto_enable"]:
-        print("  OK: Auto-enable is ON for all accounts")
-    elif org_result["configured"]:
-        print("  WARNING: Auto-enable is OFF")
-        warnings.append("Org auto-enable is disabled")
+    if org_future is None:
+        print(f"  SKIPPED: {admin_skip_reason}")
     else:
-        print("  ERROR: Org configuration not found")
-        issues.append("Organization configuration not found")
+        org_result = org_future.result()
+        if org_result.get("error"):
+            print(f"  ERROR: {org_result['error']}")
+            issues.append("Org configuration check failed")
+        elif org_result["configured"] and org_result["auto_enable"]:
+            print("  OK: Auto-enable is ON for all accounts")
+        elif org_result["configured"]:
+            print("  WARNING: Auto-enable is OFF")
+            warnings.append("Org auto-enable is disabled")
+        else:
+            print("  ERROR: Org configuration not found")
+            issues.append("Organization configuration not found")
     print("")
 
     # Check 5: Classification export
     print("Checking classification export configuration...")
-    export_result = check_classification_export(audit_session, primary_region)
-    if export_result.get("error"):
-        print(f"  ERROR: {export_result['error']}")
-        issues.append("Classification export check failed")
-    elif export_result["configured"]:
-        print(f"  OK: Exporting to {export_result['bucket']}")
-        print(f"      KMS key: {export_result['kms_key']}")
+    if export_future is None:
+        print(f"  SKIPPED: {admin_skip_reason}")
     else:
-        print("  ERROR: Classification export not configured")
-        issues.append("Classification export not configured")
+        export_result = export_future.result()
+        if export_result.get("error"):
+            print(f"  ERROR: {export_result['error']}")
+            issues.append("Classification export check failed")
+        elif export_result["configured"]:
+            print(f"  OK: Exporting to {export_result['bucket']}")
+            print(f"      KMS key: {export_result['kms_key']}")
+        else:
+            print("  ERROR: Classification export not configured")
+            issues.append("Classification export not configured")
     print("")
 
     # Check 6: Automated discovery
+    discovery_result = discovery_future.result()
     if dry_run:
         print("Checking automated sensitive data discovery...")
-        discovery_result = check_automated_discovery(audit_session, primary_region)
         if discovery_result.get("error"):
             print(f"  ERROR: {discovery_result['error']}")
             issues.append("Automated discovery check failed")
@@ -416,7 +577,6 @@ def main():
         print("")
     else:
         print("Enabling automated sensitive data discovery...")
-        discovery_result = enable_automated_discovery(audit_session, primary_region)
         if discovery_result.get("error"):
             print(f"  ERROR: {discovery_result['error']}")
             issues.append("Automated discovery enablement failed")
@@ -431,7 +591,7 @@ def main():
 
     # Check 7: Classification job
     print("Checking ccoe-weekly classification job...")
-    job_result = check_classification_jobs(audit_session, primary_region)
+    job_result = job_future.result()
     if job_result.get("error"):
         print(f"  ERROR: {job_result['error']}")
         issues.append("Classification job check failed")
@@ -443,33 +603,7 @@ def main():
         warnings.append("ccoe-weekly classification job not found")
     print("")
 
-    # Summary
-    print("=" * 60)
-    print("  Verification Summary")
-    print("=" * 60)
-    print("")
-
-    if issues:
-        print(f"Issues Found ({len(issues)}):")
-        for issue in issues:
-            print(f"  - {issue}")
-        print("")
-
-    if warnings:
-        print(f"Warnings ({len(warnings)}):")
-        for warning in warnings:
-            print(f"  - {warning}")
-        print("")
-
-    if not issues and not warnings:
-        print("All checks passed! Macie is fully configured.")
-        return 0
-    elif not issues:
-        print("Verification complete with warnings.")
-        return 0
-    else:
-        print("Verification complete with issues that need attention.")
-        return 1
+    return print_summary(issues, warnings)
 
 
 if __name__ == "__main__":